@@ -1,12 +1,21 @@
 import random
-from collections import deque
+import threading
+from bisect import bisect_left
 from datetime import timedelta
-from itertools import chain
-from types import TracebackType
-from typing import Dict, Iterable, Optional, Sequence, Type, Union
+from types import CodeType, TracebackType
+from typing import Any, Callable, ClassVar, Dict, Iterable, Iterator, List, Optional, Sequence, Type, Union
 
 from .timer import Timer
 
+# How many random samples to draw per batch for rate gating.
+_RNG_BATCH = 4096
+
+# Metric type suffixes, shared by every emission of that type.
+_TYPE_COUNT = b"|c"
+_TYPE_GAUGE = b"|g"
+_TYPE_MS = b"|ms"
+_TYPE_SET = b"|s"
+
 
 class StatsClientBase:
     _prefix: Optional[str]
@@ -16,9 +25,58 @@ class StatsClientBase:
 
     """A Base class for various statsd clients."""
 
+    def __init__(
+        self,
+        prefix: Optional[str] = None,
+        simple_tags: Optional[Sequence[str]] = None,
+        kv_tags: Optional[Dict[str, str]] = None,
+    ):
+        self._prefix = prefix
+        self._simple_tags = simple_tags or []
+        self._kv_tags = kv_tags or {}
+        # Prefix and global tags never change after construction, so
+        # precompute the fragments rebuilt on every emission otherwise.
+        # They are kept as bytes: the whole line is assembled as bytes
+        # so nothing on the hot path pays for an ascii encode walk.
+        self._prefix_dot = f"{prefix}.".encode("ascii") if prefix else b""
+        # Dedup the global simple tags once, keeping declaration order,
+        # so emissions never hash them again; the frozenset screens
+        # per-call tags against them.
+        deduped = list(dict.fromkeys(self._simple_tags))
+        self._simple_tags_set = frozenset(deduped)
+        self._simple_tags_enc = [tag.encode("ascii") for tag in deduped]
+        suffix_parts: List[bytes] = []
+        self._merge_tags_suffix(suffix_parts, None, None)
+        self._global_tags_suffix = b"".join(suffix_parts)
+        self._rng_buf: List[float] = []
+        self._rng_idx = 0
+        # Applications use a handful of distinct sample rates, so the
+        # rendered "|@rate" fragments are memoized instead of formatted
+        # on every rated emission.
+        self._rate_suffixes: Dict[float, bytes] = {}
+        self._emit_sink = self._sink()
+        self._emit_code = self._compile_emit()
+        self._emit_fast = self._bind_emit()
+
     def _send(self, data: str) -> None:
         raise NotImplementedError()
 
+    def _send_bytes(self, data: bytes) -> None:
+        raise NotImplementedError()
+
+    def _send_frames(self, frames: List[bytes]) -> None:
+        """Send pre-built frames; subclasses may batch the syscalls."""
+        for frame in frames:
+            self._send_bytes(frame)
+
+    def _sink(self) -> Callable[[bytes], Any]:
+        """Return the callable a finished line goes to, pre-bound.
+
+        Emissions call it directly — there is no intermediate dispatch
+        between assembling a line and handing it off.
+        """
+        return self._send_bytes
+
     def pipeline(self) -> "PipelineBase":
         raise NotImplementedError()
 
@@ -44,10 +102,30 @@ class StatsClientBase:
 
         `delta` can be either a number of milliseconds or a timedelta.
         """
-        if isinstance(delta, timedelta):
+        # Plain numbers dominate in practice; the exact-type test is the
+        # cheapest way to skip the isinstance machinery for them.
+        if type(delta) is not float and type(delta) is not int and isinstance(delta, timedelta):
             # Convert timedelta to number of milliseconds.
             delta = delta.total_seconds() * 1000.0
-        self._send_stat(stat, f"{delta}|ms", rate, simple_tags, kv_tags)
+        self._send_stat(stat, f"{delta:.6f}", _TYPE_MS, rate, simple_tags, kv_tags)
+
+    def timing_ns(
+        self,
+        stat: str,
+        delta_ns: int,
+        rate: float = 1,
+        simple_tags: Optional[Iterable[str]] = None,
+        kv_tags: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Send timing information measured in integer nanoseconds.
+
+        The value stays in integer space until it is rendered as
+        milliseconds, preserving nanosecond resolution without any
+        floating-point work.
+        """
+        value = f"{delta_ns // 1_000_000}.{delta_ns % 1_000_000:06d}"
+        self._send_stat(stat, value, _TYPE_MS, rate, simple_tags, kv_tags)
 
     def incr(
         self,
@@ -58,7 +136,7 @@ class StatsClientBase:
         kv_tags: Optional[Dict[str, str]] = None,
     ) -> None:
         """Increment a stat by `count`."""
-        self._send_stat(stat, f"{count}|c", rate, simple_tags, kv_tags)
+        self._send_stat(stat, count, _TYPE_COUNT, rate, simple_tags, kv_tags)
 
     def decr(
         self,
@@ -83,14 +161,14 @@ class StatsClientBase:
         """Set a gauge value."""
         if value < 0 and not delta:
             if rate < 1:
-                if random.random() > rate:
+                if self._sample() > rate:
                     return
             with self.pipeline() as pipe:
-                pipe._send_stat(stat, "0|g", 1, simple_tags, kv_tags)
-                pipe._send_stat(stat, f"{value}|g", 1, simple_tags, kv_tags)
+                pipe._send_stat(stat, 0, _TYPE_GAUGE, 1, simple_tags, kv_tags)
+                pipe._send_stat(stat, value, _TYPE_GAUGE, 1, simple_tags, kv_tags)
         else:
-            prefix = "+" if delta and value >= 0 else ""
-            self._send_stat(stat, f"{prefix}{value}|g", rate, simple_tags, kv_tags)
+            signed: Union[int, str] = f"+{value}" if delta and value >= 0 else value
+            self._send_stat(stat, signed, _TYPE_GAUGE, rate, simple_tags, kv_tags)
 
     def set(
         self,
@@ -101,21 +179,92 @@ class StatsClientBase:
         kv_tags: Optional[Dict[str, str]] = None,
     ) -> None:
         """Set a set value."""
-        self._send_stat(stat, f"{value}|s", rate, simple_tags, kv_tags)
+        self._send_stat(stat, value, _TYPE_SET, rate, simple_tags, kv_tags)
+
+    def _compile_emit(self) -> CodeType:
+        """Compile an emit function specialized to this client.
+
+        The prefix and global-tags suffix are inlined as bytes
+        literals, so the common no-per-call-tags emission runs without
+        any attribute loads or cache lookups.
+        """
+        line = 'stat.encode("ascii") + b":" + str(value).encode("ascii") + type_suffix'
+        if self._prefix_dot:
+            line = f"{self._prefix_dot!r} + {line}"
+        tail = f" + {self._global_tags_suffix!r}" if self._global_tags_suffix else ""
+        src = (
+            "def _emit(stat, value, type_suffix, rate):\n"
+            "    if rate < 1:\n"
+            "        if _sample() > rate:\n"
+            "            return\n"
+            "        rs = _memo.get(rate)\n"
+            "        if rs is None:\n"
+            '            rs = _memo[rate] = ("|@%s" % (rate,)).encode("ascii")\n'
+            f"        _sink({line} + rs{tail})\n"
+            "    else:\n"
+            f"        _sink({line}{tail})\n"
+        )
+        return compile(src, "<statsd _emit>", "exec")
+
+    def _bind_emit(self) -> Callable[..., None]:
+        """Instantiate the compiled emit against this instance's sink."""
+        ns: Dict[str, Any] = {
+            "_sample": self._sample,
+            "_sink": self._emit_sink,
+            "_memo": self._rate_suffixes,
+        }
+        exec(self._emit_code, ns)
+        return ns["_emit"]  # type: ignore[no-any-return]
 
     def _send_stat(
         self,
         stat: str,
-        value: str,
+        value: Union[int, float, str],
+        type_suffix: bytes,
         rate: float,
         simple_tags: Optional[Iterable[str]],
         kv_tags: Optional[Dict[str, str]],
     ) -> None:
-        self._after(self._prepare(stat, value, rate), simple_tags, kv_tags)
+        if not simple_tags and not kv_tags:
+            self._emit_fast(stat, value, type_suffix, rate)
+            return
+
+        if rate < 1:
+            if self._sample() > rate:
+                return
+
+        # Assemble the line in a list and join once; this avoids the
+        # chain of intermediate strings that per-piece f-string
+        # concatenation would allocate.
+        parts: List[bytes] = [self._prefix_dot, stat.encode("ascii"), b":"]
+        parts.append(str(value).encode("ascii"))
+        parts.append(type_suffix)
+        if rate < 1:
+            rate_suffix = self._rate_suffixes.get(rate)
+            if rate_suffix is None:
+                rate_suffix = self._rate_suffixes[rate] = f"|@{rate}".encode("ascii")
+            parts.append(rate_suffix)
+        self._append_tags_suffix(parts, simple_tags, kv_tags)
+        self._emit_sink(b"".join(parts))
+
+    def _sample(self) -> float:
+        """Return one uniform sample from a batch drawn in bulk.
+
+        Drawing `_RNG_BATCH` samples at once amortizes the per-call
+        overhead of `random.random` across many rated emissions.
+        """
+        i = self._rng_idx
+        buf = self._rng_buf
+        if i >= len(buf):
+            rand = random.random
+            self._rng_buf = buf = [rand() for _ in range(_RNG_BATCH)]
+            i = 0
+        self._rng_idx = i + 1
+        return buf[i]
 
     def _prepare(self, stat: str, value: str, rate: float) -> Optional[str]:
         if rate < 1:
-            if random.random() > rate:
+            if self._sample() > rate:
                 return None
             value = f"{value}|@{rate}"
 
@@ -124,51 +273,207 @@ class StatsClientBase:
 
         return f"{stat}:{value}"
 
-    def _after(
-        self, data: Optional[str], simple_tags: Optional[Iterable[str]], kv_tags: Optional[Dict[str, str]],
+    def _append_tags_suffix(
+        self, parts: List[bytes], simple_tags: Optional[Iterable[str]], kv_tags: Optional[Dict[str, str]],
     ) -> None:
+        if not simple_tags and not kv_tags:
+            # No per-call tags (None or empty, as Timer passes): the
+            # suffix is exactly the precomputed global one, which is
+            # b"" when there are no global tags either.
+            if self._global_tags_suffix:
+                parts.append(self._global_tags_suffix)
+            return
+        self._merge_tags_suffix(parts, simple_tags, kv_tags)
+
+    def _merge_tags_suffix(
+        self, parts: List[bytes], simple_tags: Optional[Iterable[str]], kv_tags: Optional[Dict[str, str]],
+    ) -> None:
+        if not kv_tags:
+            # Nothing to merge; the global dict is only read below.
+            kv_tags = self._kv_tags
+        else:
+            # Single C-level merge; per-call tags win, matching the old
+            # setdefault semantics (without mutating the caller's dict).
+            kv_tags = {**self._kv_tags, **kv_tags}
+
+        # "|#" opens the suffix on the first tag; every later tag is
+        # comma-separated. Global tags come first in declaration order,
+        # then any per-call tags not already present.
+        sep = b"|#"
+        for tag_enc in self._simple_tags_enc:
+            parts.append(sep)
+            parts.append(tag_enc)
+            sep = b","
+        if simple_tags:
+            seen = set(self._simple_tags_set)
+            for tag in simple_tags:
+                if tag not in seen:
+                    seen.add(tag)
+                    parts.append(sep)
+                    parts.append(tag.encode("ascii"))
+                    sep = b","
+        for k, v in kv_tags.items():
+            parts.append(sep)
+            parts.append(k.encode("ascii"))
+            parts.append(b":")
+            parts.append(v.encode("ascii"))
+            sep = b","
+
+
+class _LineBuffer:
+    """Metric lines accumulated in one contiguous byte buffer.
+
+    Storing encoded lines back to back (newline separated) avoids one
+    str object plus one deque slot per metric, and lets the flushers
+    slice wire-ready frames straight out of the buffer.
+    """
+
+    def __init__(self) -> None:
+        self._data = bytearray()
+        self._starts: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def append_bytes(self, line: bytes) -> None:
+        data = self._data
         if data:
-            self._send(data + self._build_tags_suffix(simple_tags, kv_tags))
+            data += b"\n"
+        self._starts.append(len(data))
+        data += line
 
-    def _build_tags_suffix(self, simple_tags: Optional[Iterable[str]], kv_tags: Optional[Dict[str, str]]) -> str:
-        stags = ",".join(set(chain((simple_tags or []), self._simple_tags)))
+    def clear(self) -> None:
+        del self._data[:]
+        del self._starts[:]
 
-        kv_tags = kv_tags or {}
-        for k, v in self._kv_tags.items():
-            kv_tags.setdefault(k, v)
+    def payload(self) -> bytes:
+        """Return every line, newline separated, as a single payload."""
+        return bytes(self._data)
 
-        kvtags = ",".join(f"{k}:{v}" for k, v in kv_tags.items())
-        tags = ",".join(x for x in (stags, kvtags) if x)
+    def frames(self, maxsize: int) -> Iterator[bytes]:
+        """Yield newline-joined frames, each smaller than `maxsize`.
+
+        Lines are never split; a line that would push the current frame
+        past the limit starts the next one.
+        """
+        starts = self._starts
+        if not starts:
+            return
+        data = self._data
+        n = len(starts)
+        # bounds[k] - 1 is the byte offset one past line k, so frame
+        # boundaries can be found with a C-level bisect over cumulative
+        # offsets instead of walking every line in Python.
+        bounds = starts[1:]
+        bounds.append(len(data) + 1)
+        # The memoryview slices without copying; only the final frames
+        # are materialized. Released before returning so the buffer can
+        # be resized again.
+        with memoryview(data) as view:
+            i = 0
+            while i < n:
+                begin = starts[i]
+                j = bisect_left(bounds, begin + maxsize + 1, i)
+                if j == i:
+                    # A single line at or over maxsize still ships alone.
+                    j = i + 1
+                end = bounds[j - 1] - 1
+                yield bytes(view[begin:end])
+                i = j
 
-        return f"|#{tags}" if tags else ""
+
+# Placeholder a pipeline points at after donating its buffer to the
+# pool; it stays empty because every write path reacquires a real
+# buffer first.
+_DETACHED_BUF = _LineBuffer()
 
 
 class PipelineBase(StatsClientBase):
-    _stats: deque
+    _stats: _LineBuffer
+    # Thread-local free list of line buffers, reused across pipeline
+    # lifetimes so short-lived pipelines (context managers, the internal
+    # negative-gauge pipeline) stop allocating a fresh buffer each time.
+    _buf_pool: ClassVar[threading.local] = threading.local()
 
     def __init__(self, client: StatsClientBase):
         self._client = client
         self._prefix = client._prefix
         self._simple_tags = client._simple_tags
         self._kv_tags = client._kv_tags
-        self._stats = deque()
+        self._prefix_dot = client._prefix_dot
+        self._global_tags_suffix = client._global_tags_suffix
+        self._simple_tags_set = client._simple_tags_set
+        self._simple_tags_enc = client._simple_tags_enc
+        self._rng_buf = []
+        self._rng_idx = 0
+        # Rates seen by the parent are just as likely here; share the memo.
+        self._rate_suffixes = client._rate_suffixes
+        self._stats = self._acquire_buf()
+        self._owns_buf = True
+        # Re-instantiate the parent's compiled emit against this
+        # pipeline's buffering sink; the compile cost is paid once per
+        # client, not per pipeline.
+        self._emit_code = client._emit_code
+        self._emit_sink = self._sink()
+        self._emit_fast = self._bind_emit()
+
+    def _sink(self) -> Callable[[bytes], Any]:
+        return self._stats.append_bytes
 
     def _send(self, data: str = "") -> None:
         raise NotImplementedError()
 
-    def _after(
-        self, data: Optional[str], simple_tags: Optional[Iterable[str]], kv_tags: Optional[Dict[str, str]],
-    ) -> None:
-        if data is not None:
-            self._stats.append(data + self._build_tags_suffix(simple_tags, kv_tags))
+    def _send_bytes(self, data: bytes) -> None:
+        # Nested pipelines flush into their parent's buffer; take a
+        # fresh one first if ours was donated at the end of a with-block.
+        if not self._owns_buf:
+            self._reacquire()
+        self._stats.append_bytes(data)
+
+    def _acquire_buf(self) -> _LineBuffer:
+        free = getattr(self._buf_pool, "free", None)
+        if free is None:
+            free = self._buf_pool.free = []
+        return free.pop() if free else _LineBuffer()
+
+    def _reacquire(self) -> None:
+        # The previous with-block donated our buffer back to the pool;
+        # take a (possibly recycled) one and re-point the emit sinks at
+        # it.
+        self._stats = self._acquire_buf()
+        self._owns_buf = True
+        self._emit_sink = self._sink()
+        self._emit_fast = self._bind_emit()
+
+    def _reacquire_sink(self, data: bytes) -> None:
+        # First emission after a with-block exit; grab a buffer before
+        # writing so nothing lands in pooled storage.
+        self._reacquire()
+        self._emit_sink(data)
 
     def __enter__(self) -> "PipelineBase":
+        if not self._owns_buf:
+            self._reacquire()
         return self
 
     def __exit__(
         self, exctype: Optional[Type[BaseException]], excinst: Optional[BaseException], exctb: Optional[TracebackType],
     ) -> Optional[bool]:
         self.send()
+        if self._owns_buf:
+            # send() left the buffer empty; hand it back for the next
+            # pipeline on this thread (which may differ from the
+            # creating thread, hence the guarded lookup). Detach our
+            # sinks at the same time so a later emission reacquires a
+            # buffer instead of aliasing the donated one.
+            free = getattr(self._buf_pool, "free", None)
+            if free is None:
+                free = self._buf_pool.free = []
+            free.append(self._stats)
+            self._owns_buf = False
+            self._stats = _DETACHED_BUF
+            self._emit_sink = self._reacquire_sink
+            self._emit_fast = self._bind_emit()
         return None
 
     def send(self) -> None:
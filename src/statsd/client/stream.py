@@ -6,7 +6,7 @@ from .base import PipelineBase, StatsClientBase
 
 class StreamPipeline(PipelineBase):
     def _send(self, data: str = "") -> None:
-        self._client._after("\n".join(self._stats), None, None)
+        self._client._send_bytes(self._stats.payload())
         self._stats.clear()
 
 
@@ -30,12 +30,18 @@ class StreamClientBase(StatsClientBase):
 
     def _send(self, data: str) -> None:
         """Send data to statsd."""
+        self._send_bytes(data.encode("ascii"))
+
+    def _send_bytes(self, data: bytes) -> None:
         if not self._sock:
             self.connect()
-        self._do_send(data)
+        self._do_send_bytes(data)
 
     def _do_send(self, data: str) -> None:
-        self._sock.sendall(data.encode("ascii") + b"\n")  # type: ignore
+        self._do_send_bytes(data.encode("ascii"))
+
+    def _do_send_bytes(self, data: bytes) -> None:
+        self._sock.sendall(data + b"\n")  # type: ignore
 
 
 class TCPStatsClient(StreamClientBase):
@@ -48,23 +54,27 @@ class TCPStatsClient(StreamClientBase):
         prefix: Optional[str] = None,
         timeout: int = None,
         ipv6: bool = False,
+        nodelay: bool = True,
         simple_tags: Optional[Sequence[str]] = None,
         kv_tags: Optional[Dict[str, str]] = None,
     ):
         """Create a new client."""
+        super().__init__(prefix, simple_tags, kv_tags)
         self._host = host
         self._port = port
         self._ipv6 = ipv6
+        self._nodelay = nodelay
         self._timeout = timeout
-        self._prefix = prefix
-        self._simple_tags = simple_tags or []
-        self._kv_tags = kv_tags or {}
         self._sock = None
 
     def connect(self) -> None:
         fam = socket.AF_INET6 if self._ipv6 else socket.AF_INET
         family, _, _, _, addr = socket.getaddrinfo(self._host, self._port, fam, socket.SOCK_STREAM)[0]
         self._sock = socket.socket(family, socket.SOCK_STREAM)
+        if self._nodelay:
+            # Each metric is a tiny write; without TCP_NODELAY, Nagle's
+            # algorithm holds them back waiting for an ACK.
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         self._sock.settimeout(self._timeout)
         self._sock.connect(addr)
 
@@ -76,9 +86,9 @@ class UnixSocketStatsClient(StreamClientBase):
         self, socket_path: str, prefix: Optional[str] = None, suffix: Optional[str] = None, timeout: int = None,
     ):
         """Create a new client."""
+        super().__init__(prefix)
         self._socket_path = socket_path
         self._timeout = timeout
-        self._prefix = prefix
         self._suffix = suffix
         self._sock = None
 
@@ -1,5 +1,5 @@
 import functools
-from time import perf_counter
+from time import perf_counter_ns
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional, Type
 
@@ -7,17 +7,27 @@ if TYPE_CHECKING:
     from statsd.client.base import StatsClientBase
 
 
+@functools.lru_cache(maxsize=1024)
+def _unwrap_partial(f: Callable) -> Callable:
+    while isinstance(f, functools.partial):
+        f = f.func
+    return f
+
+
 def safe_wraps(wrapper: Callable, *args: Any, **kwargs: Any) -> Callable:
-    """Safely wraps partial functions."""
-    while isinstance(wrapper, functools.partial):
-        wrapper = wrapper.func
-    return functools.wraps(wrapper, *args, **kwargs)
+    """Safely wraps partial functions.
+
+    The unwrap result is deterministic per function, so it is cached
+    for callers that decorate dynamically created callables.
+    """
+    return functools.wraps(_unwrap_partial(wrapper), *args, **kwargs)
 
 
 class Timer:
     """A context manager/decorator for statsd.timing()."""
 
-    _start_time: Optional[float]
+    _start_ns: Optional[int]
+    _delta_ns: Optional[int]
     ms: Optional[float]
 
     def __init__(
@@ -33,21 +43,29 @@ class Timer:
         self.rate = rate
         self.ms = None
         self._sent = False
-        self._start_time = None
+        self._start_ns = None
+        self._delta_ns = None
         self._simple_tags = simple_tags or []
         self._kv_tags = kv_tags or {}
 
     def __call__(self, f: Callable) -> Callable:
         """Thread-safe timing function decorator."""
+        # Bind everything the wrapper needs as closure locals so each
+        # invocation skips the per-call attribute lookups on self.
+        timing_ns = self.client.timing_ns
+        stat = self.stat
+        rate = self.rate
+        simple_tags = self._simple_tags
+        kv_tags = self._kv_tags
+        clock = perf_counter_ns
 
         @safe_wraps(f)
         def _wrapped(*args: Any, **kwargs: Any) -> Any:
-            start_time = perf_counter()
+            start_ns = clock()
             try:
                 return f(*args, **kwargs)
             finally:
-                elapsed_time_ms = 1000.0 * (perf_counter() - start_time)
-                self.client.timing(self.stat, elapsed_time_ms, self.rate, self._simple_tags, self._kv_tags)
+                timing_ns(stat, clock() - start_ns, rate, simple_tags, kv_tags)
 
         return _wrapped  # type: ignore
 
@@ -63,24 +81,27 @@ class Timer:
     def start(self) -> "Timer":
         self.ms = None
         self._sent = False
-        self._start_time = perf_counter()
+        self._delta_ns = None
+        self._start_ns = perf_counter_ns()
         return self
 
     def stop(
         self, send: bool = True, simple_tags: Optional[Iterable[str]] = None, kv_tags: Optional[Dict[str, str]] = None,
     ) -> "Timer":
-        if self._start_time is None:
+        if self._start_ns is None:
             raise RuntimeError("Timer has not started.")
-        dt = perf_counter() - self._start_time
-        self.ms = 1000.0 * dt  # Convert to milliseconds.
+        self._delta_ns = perf_counter_ns() - self._start_ns
+        self.ms = self._delta_ns / 1_000_000  # Convert to milliseconds.
         if send:
             self.send(simple_tags, kv_tags)
         return self
 
-    def send(self, simple_tags: Optional[Iterable[str]], kv_tags: Optional[Dict[str, str]]) -> None:
-        if self.ms is None:
+    def send(
+        self, simple_tags: Optional[Iterable[str]] = None, kv_tags: Optional[Dict[str, str]] = None,
+    ) -> None:
+        if self._delta_ns is None:
             raise RuntimeError("No data recorded.")
         if self._sent:
             raise RuntimeError("Already sent data.")
         self._sent = True
-        self.client.timing(self.stat, self.ms, self.rate, simple_tags, kv_tags)
+        self.client.timing_ns(self.stat, self._delta_ns, self.rate, simple_tags, kv_tags)
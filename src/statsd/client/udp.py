@@ -1,7 +1,61 @@
+import ctypes
 import socket
-from typing import Dict, Optional, Sequence
+import struct
+import sys
+import threading
+from queue import SimpleQueue
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
-from .base import PipelineBase, StatsClientBase
+from .base import PipelineBase, StatsClientBase, _LineBuffer
+
+# Linux can ship a whole pipeline flush in one sendmmsg(2) syscall
+# instead of one sendto(2) per datagram.
+_sendmmsg: Optional[Callable[..., int]] = None
+if sys.platform == "linux":
+    try:
+        _libc = ctypes.CDLL("libc.so.6", use_errno=True)
+        _sendmmsg = _libc.sendmmsg
+    except (OSError, AttributeError):
+        _sendmmsg = None
+
+
+class _iovec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _msghdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint),
+        ("msg_iov", ctypes.POINTER(_iovec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _mmsghdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _msghdr), ("msg_len", ctypes.c_uint)]
+
+
+def _pack_sockaddr(family: int, addr: Tuple) -> bytes:
+    """Render `addr` as a raw struct sockaddr for sendmmsg."""
+    if family == socket.AF_INET:
+        host, port = addr
+        return b"".join([
+            struct.pack("@H", socket.AF_INET),
+            struct.pack("!H", port),
+            socket.inet_pton(socket.AF_INET, host),
+            bytes(8),
+        ])
+    host, port, flowinfo, scope_id = addr
+    return b"".join([
+        struct.pack("@H", socket.AF_INET6),
+        struct.pack("!HI", port, flowinfo),
+        socket.inet_pton(socket.AF_INET6, host),
+        struct.pack("@I", scope_id),
+    ])
 
 
 class Pipeline(PipelineBase):
@@ -10,16 +64,99 @@ class Pipeline(PipelineBase):
         self._maxudpsize = client._maxudpsize
 
     def _send(self, data: str = "") -> None:
-        data = self._stats.popleft()
-        while self._stats:
-            # Use popleft to preserve the order of the stats.
-            stat = self._stats.popleft()
-            if len(stat) + len(data) + 1 >= self._maxudpsize:
-                self._client._after(data, None, None)
-                data = stat
+        self._client._send_frames(list(self._stats.frames(self._maxudpsize)))
+        self._stats.clear()
+
+
+class ThreadedPipeline(PipelineBase):
+    """A pipeline that multiple threads can feed concurrently.
+
+    Metrics are enqueued on a ``queue.SimpleQueue`` — its put is
+    reentrant and effectively lock-free under the GIL — and a daemon
+    thread owns the line buffer, so producers never contend on shared
+    buffer state. Nothing reaches the wire until ``send()``, which
+    blocks until the worker has flushed everything enqueued before it.
+    The trade-off is consumer-side latency: the handoff to the worker
+    adds a queue hop per metric. Call ``close()`` when done to stop
+    the worker; the pipeline raises ``RuntimeError`` on use after that.
+    """
+
+    def __init__(self, client: StatsClientBase):
+        # The queue must exist before the base constructor binds the
+        # emit sink to it.
+        self._queue: "SimpleQueue[Union[bytes, threading.Event, None]]" = SimpleQueue()
+        self._closed = False
+        self._flush_error: Optional[BaseException] = None
+        super().__init__(client)
+        self._maxudpsize = client._maxudpsize
+        self._worker = threading.Thread(target=self._drain, daemon=True)
+        self._worker.start()
+
+    def _sink(self) -> Callable[[bytes], Any]:
+        return self._send_bytes
+
+    def _send_bytes(self, data: bytes) -> None:
+        if self._closed:
+            raise RuntimeError("ThreadedPipeline is closed.")
+        self._queue.put(data)
+
+    def _drain(self) -> None:
+        buf = _LineBuffer()
+        send_frames = self._client._send_frames
+        while True:
+            item = self._queue.get()
+            if item is None:
+                # Closing; a failed final flush is recorded rather
+                # than raised from a thread nobody is watching.
+                try:
+                    self._flush(buf, send_frames)
+                except Exception as exc:
+                    self._flush_error = exc
+                return
+            if isinstance(item, threading.Event):
+                # Wake the waiter even when the flush blows up —
+                # otherwise send() would block on the event forever.
+                # The error is kept for send() to re-raise, and the
+                # worker stays alive; the unflushed lines get another
+                # chance on the next flush.
+                try:
+                    self._flush(buf, send_frames)
+                except Exception as exc:
+                    self._flush_error = exc
+                finally:
+                    item.set()
             else:
-                data += "\n" + stat
-        self._client._after(data, None, None)
+                buf.append_bytes(item)
+
+    def _flush(self, buf: _LineBuffer, send_frames: Callable[[List[bytes]], Any]) -> None:
+        send_frames(list(buf.frames(self._maxudpsize)))
+        buf.clear()
+
+    def send(self) -> None:
+        if self._closed:
+            # The worker is gone; waiting on it would block forever.
+            raise RuntimeError("ThreadedPipeline is closed.")
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+        exc = self._flush_error
+        if exc is not None:
+            self._flush_error = None
+            raise exc
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._worker.join()
+
+    def pipeline(self) -> PipelineBase:
+        # A nested pipeline (including the internal negative-gauge one)
+        # has a single caller, so the queue hop buys nothing — and a
+        # nested ThreadedPipeline would leak its worker thread. Buffer
+        # locally and flush into the queue instead.
+        return Pipeline(self)
 
 
 class StatsClient(StatsClientBase):
@@ -32,26 +169,79 @@ class StatsClient(StatsClientBase):
         prefix: Optional[str] = None,
         maxudpsize: int = 512,
         ipv6: bool = False,
+        sndbuf: int = 1 << 20,
         simple_tags: Optional[Sequence[str]] = None,
         kv_tags: Optional[Dict[str, str]] = None,
     ):
         """Create a new client."""
+        super().__init__(prefix, simple_tags, kv_tags)
         fam = socket.AF_INET6 if ipv6 else socket.AF_INET
         family, _, _, _, addr = socket.getaddrinfo(host, port, fam, socket.SOCK_DGRAM)[0]
         self._addr = addr
         self._sock = socket.socket(family, socket.SOCK_DGRAM)
-        self._prefix = prefix
-        self._simple_tags = simple_tags or []
-        self._kv_tags = kv_tags or {}
+        # A roomy send buffer lets the kernel absorb pipelined bursts;
+        # non-blocking mode means a full buffer drops the packet (and
+        # bumps the counter) instead of stalling the caller.
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, sndbuf)
+        self._sock.setblocking(False)
+        self._dropped = 0
         self._maxudpsize = maxudpsize
+        # Raw destination sockaddr for the sendmmsg batch path; the
+        # socket stays unconnected, so each message names it explicitly.
+        self._sockaddr = _pack_sockaddr(family, addr) if _sendmmsg is not None else None
 
     def _send(self, data: str) -> None:
         """Send data to statsd."""
+        self._send_bytes(data.encode("ascii"))
+
+    def _send_bytes(self, data: bytes) -> None:
         try:
-            self._sock.sendto(data.encode("ascii"), self._addr)
+            self._sock.sendto(data, self._addr)
         except (OSError, RuntimeError):
-            # No time for love, Dr. Jones!
-            pass
+            # No time for love, Dr. Jones! But keep count of the drops.
+            self._dropped += 1
+
+    def _send_frames(self, frames: List[bytes]) -> None:
+        # Batching only pays off for multi-frame flushes, and the raw
+        # fileno path needs a real socket underneath.
+        if len(frames) >= 2 and self._sockaddr is not None and isinstance(self._sock, socket.socket):
+            try:
+                self._sendmmsg_frames(frames)
+            except (OSError, RuntimeError):
+                self._dropped += len(frames)
+            return
+        for frame in frames:
+            self._send_bytes(frame)
+
+    def _sendmmsg_frames(self, frames: List[bytes]) -> None:
+        n = len(frames)
+        iovecs = (_iovec * n)()
+        hdrs = (_mmsghdr * n)()
+        addr_buf = ctypes.create_string_buffer(self._sockaddr, len(self._sockaddr))  # type: ignore[arg-type]
+        addr_ptr = ctypes.cast(addr_buf, ctypes.c_void_p)
+        addr_len = len(self._sockaddr)  # type: ignore[arg-type]
+        for i, frame in enumerate(frames):
+            # c_char_p points straight into the frame bytes; `frames`
+            # keeps them alive for the duration of the syscalls.
+            iovecs[i].iov_base = ctypes.cast(ctypes.c_char_p(frame), ctypes.c_void_p)
+            iovecs[i].iov_len = len(frame)
+            hdr = hdrs[i].msg_hdr
+            hdr.msg_name = addr_ptr
+            hdr.msg_namelen = addr_len
+            hdr.msg_iov = ctypes.pointer(iovecs[i])
+            hdr.msg_iovlen = 1
+        fileno = self._sock.fileno()
+        sent_total = 0
+        while sent_total < n:
+            sent = _sendmmsg(  # type: ignore[misc]
+                fileno, ctypes.byref(hdrs, sent_total * ctypes.sizeof(_mmsghdr)), n - sent_total, 0,
+            )
+            if sent <= 0:
+                raise OSError(ctypes.get_errno(), "sendmmsg failed")
+            sent_total += sent
 
     def pipeline(self) -> PipelineBase:
         return Pipeline(self)
+
+    def threaded_pipeline(self) -> ThreadedPipeline:
+        return ThreadedPipeline(self)
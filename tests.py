@@ -2,6 +2,7 @@ import functools
 import random
 import re
 import socket
+import threading
 from datetime import timedelta
 from unittest import SkipTest
 
@@ -336,6 +337,9 @@ def _test_gauge_absolute_negative_rate(cl, proto, mock_random):
     _sock_check(cl._sock, 1, proto, "foo:0|g\nfoo:-1|g")
 
     mock_random.return_value = 2
+    # Samples are drawn in batches; force a refill so the new mocked
+    # value is picked up.
+    cl._rng_buf = []
     cl.gauge("foo", -2, rate=0.5, delta=False)
     # Should not have changed.
     _sock_check(cl._sock, 1, proto, "foo:0|g\nfoo:-1|g")
@@ -835,6 +839,37 @@ def test_pipeline_manager_tcp():
     _test_pipeline_manager(cl, "tcp")
 
 
+def test_pipeline_usable_after_manager_exit():
+    """A pipeline used past its with-block must not alias pooled buffers."""
+    cl = _udp_client()
+    pending = cl.pipeline()
+    pending.incr("pending")
+    with cl.pipeline() as pipe:
+        pipe.incr("inside")
+    pipe.incr("later")
+    # The internal negative-gauge pipeline draws from the pool; it must
+    # not pick up "later" or "pending".
+    cl.gauge("neg", -5)
+    _sock_check(cl._sock, 2, "udp", "neg:0|g\nneg:-5|g")
+    pipe.send()
+    _sock_check(cl._sock, 3, "udp", "later:1|c")
+    pending.send()
+    _sock_check(cl._sock, 4, "udp", "pending:1|c")
+
+
+def test_pipeline_reentered_manager():
+    """Re-entering a pipeline must not donate its buffer to the pool twice."""
+    cl = _udp_client()
+    pipe = cl.pipeline()
+    with pipe:
+        with pipe:
+            pipe.incr("foo")
+    _sock_check(cl._sock, 1, "udp", "foo:1|c")
+    p1 = cl.pipeline()
+    p2 = cl.pipeline()
+    assert p1._stats is not p2._stats
+
+
 def _test_pipeline_timer_manager(cl, proto):
     with cl.pipeline() as pipe:
         with pipe.timer("foo"):
@@ -1005,6 +1040,73 @@ def test_pipeline_packet_size():
     assert len(sc._sock.sendto.call_args_list[1][0][0]) <= 512
 
 
+def test_pipeline_multi_frame_real_socket():
+    """Multi-frame flushes arrive intact over a real UDP socket."""
+    recv = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    recv.bind(("127.0.0.1", 0))
+    recv.settimeout(2)
+    port = recv.getsockname()[1]
+    sc = StatsClient(host="127.0.0.1", port=port)
+    pipe = sc.pipeline()
+    for x in range(32):
+        # 32 * 21 bytes needs two datagrams.
+        pipe.incr("sixteen_char_str")
+    pipe.send()
+    received = recv.recv(65536) + b"\n" + recv.recv(65536)
+    eq_(32, received.decode("ascii").count("sixteen_char_str:1|c"))
+    recv.close()
+
+
+def test_threaded_pipeline():
+    """ThreadedPipeline flushes queued metrics from a background thread."""
+    cl = _udp_client()
+    pipe = cl.threaded_pipeline()
+    pipe.incr("foo")
+    pipe.decr("bar")
+    pipe.send()
+    _sock_check(cl._sock, 1, "udp", "foo:1|c\nbar:-1|c")
+    pipe.close()
+
+
+def test_threaded_pipeline_negative_gauge():
+    """Negative gauges on a ThreadedPipeline must not leak worker threads."""
+    cl = _udp_client()
+    pipe = cl.threaded_pipeline()
+    before = threading.active_count()
+    pipe.gauge("foo", -5)
+    eq_(before, threading.active_count())
+    pipe.send()
+    _sock_check(cl._sock, 1, "udp", "foo:0|g\nfoo:-5|g")
+    pipe.close()
+
+
+def test_threaded_pipeline_flush_error_wakes_sender():
+    """A failing flush must wake send() and surface the error."""
+    cl = _udp_client()
+    # The worker binds _send_frames when it starts, so patch first.
+    cl._send_frames = mock.Mock(side_effect=[ValueError("boom"), None, None])
+    pipe = cl.threaded_pipeline()
+    pipe.incr("foo")
+    with assert_raises(ValueError):
+        pipe.send()
+    # The worker survived; the unflushed line ships on the retry.
+    pipe.send()
+    eq_(mock.call([b"foo:1|c"]), cl._send_frames.call_args)
+    pipe.close()
+
+
+def test_threaded_pipeline_use_after_close():
+    """ThreadedPipeline raises RuntimeError once closed."""
+    cl = _udp_client()
+    pipe = cl.threaded_pipeline()
+    pipe.close()
+    pipe.close()  # Closing again is a no-op.
+    with assert_raises(RuntimeError):
+        pipe.incr("foo")
+    with assert_raises(RuntimeError):
+        pipe.send()
+
+
 @mock.patch.object(socket, "socket")
 def test_tcp_raises_exception_to_user(mock_socket):
     """Socket errors in TCPStatsClient should be raised to user."""